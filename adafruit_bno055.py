@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2017 Radomir Dopieralski for Adafruit Industries
 #
 # SPDX-License-Identifier: MIT
+# pylint: disable=too-many-lines
 
 """
 `adafruit_bno055`
@@ -25,22 +26,24 @@ inertial measurement unit module with sensor fusion.
 
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 
-* Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
-
 """
 import time
 import struct
 
 from micropython import const
 from adafruit_bus_device.i2c_device import I2CDevice
-from adafruit_register.i2c_struct import Struct, UnaryStruct
 
 try:
-    from typing import Any, Optional, Tuple, Type, Union
+    from typing import Any, Iterator, Optional, Tuple, Type, Union
     from busio import I2C, UART
 except ImportError:
     pass
 
+# Mode switch deadlines are kept in integer nanoseconds: the float returned by
+# monotonic() stops resolving milliseconds after a few hours of uptime on
+# CircuitPython. Builds without monotonic_ns() sleep the switches out instead.
+_monotonic_ns = getattr(time, "monotonic_ns", None)
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BNO055.git"
 
@@ -59,6 +62,11 @@ COMPASS_MODE = const(0x09)
 M4G_MODE = const(0x0A)
 NDOF_FMC_OFF_MODE = const(0x0B)
 NDOF_MODE = const(0x0C)
+# Mode bitmasks: bit n is set when mode n is a member
+_FUSION_MODES = const(0x1F00)  # IMUPLUS through NDOF
+_ACCEL_DISABLED_MODES = const(0x004D)  # CONFIG, MAGONLY, GYRONLY, MAGGYRO
+_MAGNET_DISABLED_MODES = const(0x012B)  # CONFIG, ACCONLY, GYRONLY, ACCGYRO, IMUPLUS
+_GYRO_DISABLED_MODES = const(0x0617)  # CONFIG, ACCONLY, MAGONLY, ACCMAG, COMPASS, M4G
 
 ACCEL_2G = const(0x00)  # For accel_range property
 ACCEL_4G = const(0x01)  # Default
@@ -125,15 +133,24 @@ _ACCEL_CONFIG_REGISTER = const(0x08)
 _MAGNET_CONFIG_REGISTER = const(0x09)
 _GYRO_CONFIG_0_REGISTER = const(0x0A)
 _GYRO_CONFIG_1_REGISTER = const(0x0B)
+# Offsets of the page 1 config registers in the block read by _configure()
+_ACCEL_CONFIG = const(0)
+_MAGNET_CONFIG = const(1)
+_GYRO_CONFIG_0 = const(2)
 _CALIBRATION_REGISTER = const(0x35)
 _OFFSET_ACCEL_REGISTER = const(0x55)
 _OFFSET_MAGNET_REGISTER = const(0x5B)
 _OFFSET_GYRO_REGISTER = const(0x61)
 _RADIUS_ACCEL_REGISTER = const(0x67)
 _RADIUS_MAGNET_REGISTER = const(0x69)
+# the offsets and radii above are contiguous, 11 little-endian int16 values
+_CALIBRATION_LENGTH = const(22)
 _TRIGGER_REGISTER = const(0x3F)
 _POWER_REGISTER = const(0x3E)
 _ID_REGISTER = const(0x00)
+_STATUS_REGISTER = const(0x39)
+_STATUS_FUSION_RUNNING = const(0x05)
+_STATUS_RUNNING = const(0x06)  # without fusion
 # Axis remap registers and values
 _AXIS_MAP_CONFIG_REGISTER = const(0x41)
 _AXIS_MAP_SIGN_REGISTER = const(0x42)
@@ -143,53 +160,213 @@ AXIS_REMAP_Z = const(0x02)
 AXIS_REMAP_POSITIVE = const(0x00)
 AXIS_REMAP_NEGATIVE = const(0x01)
 
+# Sensor output block: accel, mag, gyro, euler, quaternion, linear accel and
+# gravity occupy 44 contiguous bytes starting at 0x08 (Table 4-2)
+_DATA_REGISTER = const(0x08)
+_DATA_LENGTH = const(44)
+# the output block followed by the temperature and calibration status bytes
+_RAW_LENGTH = const(46)
+# euler, quaternion, linear accel and gravity: the fusion outputs at the end
+_FUSED_REGISTER = const(0x1A)
+_FUSED_LENGTH = const(26)
+_QUATERNION_REGISTER = const(0x20)
+_ACCEL_SCALE = 1 / 100
+_MAGNET_SCALE = 1 / 16
+_GYRO_SCALE = 0.001090830782496456
+_EULER_SCALE = 1 / 16
+_QUATERNION_SCALE = 1 / (1 << 14)
+# Returned by the data properties for outputs disabled by the current mode
+_EMPTY_VECTOR = (None, None, None)
+_EMPTY_QUATERNION = (None, None, None, None)
+# The chip takes 650 ms (typ.) to come out of reset; its id is polled with a
+# delay starting at 10 ms and doubling up to this, until this timeout
+_RESET_MAX_DELAY = 0.1
+_RESET_TIMEOUT = 0.8
+# the id answers before the chip has finished initialising, so it is given
+# this long more before the first configuration writes
+_RESET_SETTLE = 0.05
+
+
+def _scaled_vector(
+    values: Tuple[int, ...], start: int, scale: float
+) -> Tuple[float, float, float]:
+    return (scale * values[start], scale * values[start + 1], scale * values[start + 2])
+
+
+def _scaled_quaternion(
+    values: Tuple[int, ...], start: int, scale: float
+) -> Tuple[float, float, float, float]:
+    return (
+        scale * values[start],
+        scale * values[start + 1],
+        scale * values[start + 2],
+        scale * values[start + 3],
+    )
+
+
+def _reset_delays() -> Iterator[float]:
+    # growing poll delays, so a quick warm reset isn't padded to the worst case
+    delay = 0.01
+    deadline = time.monotonic() + _RESET_TIMEOUT
+    while time.monotonic() < deadline:
+        yield delay
+        delay = min(delay * 2, _RESET_MAX_DELAY)
+
+
+def rotate_vector(
+    quaternion: Tuple[float, float, float, float], vector: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """Rotates ``vector`` by a unit ``quaternion`` in the ``(w, x, y, z)`` order
+    returned by :attr:`BNO055.quaternion`, e.g. to bring a sensor frame vector into
+    the world frame.
+
+    Only plain arithmetic is used, so this runs on CircuitPython. On CPython each
+    component may also be a NumPy array, which rotates a whole batch of samples in
+    one call.
+    """
+    w, x, y, z = quaternion
+    v_x, v_y, v_z = vector
+    # v' = v + w * t + cross(q.xyz, t) with t = 2 * cross(q.xyz, v)
+    t_x = 2 * (y * v_z - z * v_y)
+    t_y = 2 * (z * v_x - x * v_z)
+    t_z = 2 * (x * v_y - y * v_x)
+    return (
+        v_x + w * t_x + y * t_z - z * t_y,
+        v_y + w * t_y + z * t_x - x * t_z,
+        v_z + w * t_z + x * t_y - y * t_x,
+    )
+
+
+class _ReadOnlyStruct:  # pylint: disable=too-few-public-methods
+    def __init__(self, register_address: int, struct_format: str) -> None:
+        self.address = register_address
+        self.format = struct_format
+        self.size = struct.calcsize(struct_format)
+
+    def _unpack(self, obj: "BNO055") -> Tuple[int, ...]:
+        # pylint: disable=protected-access
+        expires = obj._snapshot_expires
+        if not (expires and time.monotonic() < expires):
+            if obj.auto_refresh is None:
+                buffer = obj._data_buffer
+                obj._read_block(self.address, buffer, self.size)
+                return struct.unpack_from(self.format, buffer)
+            obj.refresh(obj.auto_refresh)
+        # served from the block read by BNO055.refresh()
+        return struct.unpack_from(
+            self.format, obj._snapshot, self.address - _DATA_REGISTER
+        )
+
+    def __set__(self, obj: Optional["BNO055"], value: Any) -> None:
+        raise NotImplementedError()
+
 
-class _ScaledReadOnlyStruct(Struct):  # pylint: disable=too-few-public-methods
+class _ScaledReadOnlyStruct(_ReadOnlyStruct):
+    # pylint: disable=too-few-public-methods,abstract-method
     def __init__(self, register_address: int, struct_format: str, scale: float) -> None:
         super().__init__(register_address, struct_format)
         self.scale = scale
 
     def __get__(
-        self, obj: Optional["BNO055_I2C"], objtype: Optional[Type["BNO055_I2C"]] = None
+        self, obj: Optional["BNO055"], objtype: Optional[Type["BNO055"]] = None
     ) -> Tuple[float, float, float]:
-        result = super().__get__(obj, objtype)
-        return tuple(self.scale * v for v in result)
+        result = self._unpack(obj)
+        scale = self.scale
+        return (scale * result[0], scale * result[1], scale * result[2])
 
-    def __set__(self, obj: Optional["BNO055_I2C"], value: Any) -> None:
-        raise NotImplementedError()
 
+class _ScaledReadOnlyQuaternionStruct(_ScaledReadOnlyStruct):
+    # pylint: disable=too-few-public-methods,abstract-method
+    def __get__(
+        self, obj: Optional["BNO055"], objtype: Optional[Type["BNO055"]] = None
+    ) -> Tuple[float, float, float, float]:
+        result = self._unpack(obj)
+        scale = self.scale
+        return (
+            scale * result[0],
+            scale * result[1],
+            scale * result[2],
+            scale * result[3],
+        )
+
+
+class _ReadOnlyUnaryStruct(_ReadOnlyStruct):
+    # pylint: disable=too-few-public-methods,abstract-method
+    def __get__(
+        self, obj: Optional["BNO055"], objtype: Optional[Type["BNO055"]] = None
+    ) -> Any:
+        return self._unpack(obj)[0]
 
-class _ReadOnlyUnaryStruct(UnaryStruct):  # pylint: disable=too-few-public-methods
-    def __set__(self, obj: Optional["BNO055_I2C"], value: Any) -> None:
-        raise NotImplementedError()
+
+class _ReadOnlyTupleStruct(_ReadOnlyStruct):
+    # pylint: disable=too-few-public-methods,abstract-method
+    def __get__(
+        self, obj: Optional["BNO055"], objtype: Optional[Type["BNO055"]] = None
+    ) -> Tuple[int, ...]:
+        return self._unpack(obj)
 
 
-class _ModeStruct(Struct):  # pylint: disable=too-few-public-methods
+class _ModeStruct:  # pylint: disable=too-few-public-methods
     def __init__(self, register_address: int, struct_format: str, mode: int) -> None:
-        super().__init__(register_address, struct_format)
+        self.address = register_address
+        self.format = struct_format
+        self.size = struct.calcsize(struct_format)
         self.mode = mode
+        # whether the format holds a single value, decided once up front
+        self.single = len(struct.unpack(struct_format, bytes(self.size))) == 1
 
     def __get__(
-        self, obj: Optional["BNO055_I2C"], objtype: Optional[Type["BNO055_I2C"]] = None
+        self, obj: Optional["BNO055"], objtype: Optional[Type["BNO055"]] = None
     ) -> Union[int, Tuple[int, int, int]]:
         last_mode = obj.mode
         obj.mode = self.mode
-        result = super().__get__(obj, objtype)
+        # pylint: disable=protected-access
+        buffer = obj._data_buffer
+        obj._read_block(self.address, buffer, self.size)
+        result = struct.unpack_from(self.format, buffer)
         obj.mode = last_mode
         # single value comes back as a one-element tuple
-        return result[0] if isinstance(result, tuple) and len(result) == 1 else result
+        return result[0] if self.single else result
 
     def __set__(
-        self, obj: Optional["BNO055_I2C"], value: Union[int, Tuple[int, int, int]]
+        self, obj: Optional["BNO055"], value: Union[int, Tuple[int, int, int]]
     ) -> None:
         last_mode = obj.mode
         obj.mode = self.mode
-        # underlying __set__() expects a tuple
+        # struct.pack() expects a tuple
         set_val = value if isinstance(value, tuple) else (value,)
-        super().__set__(obj, set_val)
+        # pylint: disable=protected-access
+        obj._write_block(self.address, struct.pack(self.format, *set_val))
         obj.mode = last_mode
 
 
+class _I2CBatch:
+    """Holds a sensor's I2CDevice locked, see BNO055_I2C.batch()."""
+
+    def __init__(self, sensor: "BNO055_I2C") -> None:
+        self.sensor = sensor
+        self.depth = 0
+
+    def __enter__(self) -> I2CDevice:
+        sensor = self.sensor
+        if not self.depth:
+            # wait out a pending mode switch before taking the bus, not under it
+            sensor._wait_ready()  # pylint: disable=protected-access
+            sensor.i2c_device.__enter__()
+            # register accesses now enter this object instead of the device
+            sensor._bus = self  # pylint: disable=protected-access
+        self.depth += 1
+        return sensor.i2c_device
+
+    def __exit__(self, *exc: Any) -> bool:
+        self.depth -= 1
+        if not self.depth:
+            sensor = self.sensor
+            sensor._bus = sensor.i2c_device  # pylint: disable=protected-access
+            sensor.i2c_device.__exit__(*exc)
+        return False
+
+
 class BNO055:  # pylint: disable=too-many-public-methods
     """
     Base class for the BNO055 9DOF IMU sensor.
@@ -220,30 +397,111 @@ class BNO055:  # pylint: disable=too-many-public-methods
 
     """
 
+    _calibration = _ReadOnlyUnaryStruct(_CALIBRATION_REGISTER, "B")
+    _quaternion_q14 = _ReadOnlyTupleStruct(_QUATERNION_REGISTER, "<hhhh")
+
     def __init__(self) -> None:
+        self._cached_mode = None
+        self._ready_at = 0
+        self._ready_status = None
+        self._page = None
+        # scratch for every block read, descriptors included; reads never nest
+        self._data_buffer = bytearray(_DATA_LENGTH)
+        self._snapshot = bytearray(_RAW_LENGTH)
+        self._snapshot_expires = 0
+        self.auto_refresh = None
         chip_id = self._read_register(_ID_REGISTER)
         if chip_id != _CHIP_ID:
             raise RuntimeError(f"bad chip id ({chip_id:#x} != {_CHIP_ID:#x})")
         self._reset()
-        self.set_normal_mode()
-        self._write_register(_PAGE_REGISTER, 0x00)
-        self._write_register(_TRIGGER_REGISTER, 0x00)
-        self.accel_range = ACCEL_4G
-        self.gyro_range = GYRO_2000_DPS
-        self.magnet_rate = MAGNET_20HZ
+        self._configure()
+
+    def _configure(self) -> None:
+        self._write_startup_config()
+        # the chip is idle in CONFIG_MODE either way, so the system status has
+        # nothing to say about the power mode change; give it its full 10 ms
         time.sleep(0.01)
         self.mode = NDOF_MODE
-        time.sleep(0.01)
+
+    def _write_startup_config(self) -> None:
+        # read-modify-write the page 1 sensor config registers (0x08-0x0A)
+        config = self._data_buffer
+        self._set_page(1)
+        self._read_block(_ACCEL_CONFIG_REGISTER, config, 3)
+        config[_ACCEL_CONFIG] = (config[_ACCEL_CONFIG] & 0b11111100) | ACCEL_4G
+        config[_GYRO_CONFIG_0] = (config[_GYRO_CONFIG_0] & 0b00111000) | GYRO_2000_DPS
+        config[_MAGNET_CONFIG] = (config[_MAGNET_CONFIG] & 0b01111000) | MAGNET_20HZ
+        # still in CONFIG_MODE after the reset, so the startup writes can be
+        # issued back to back without any mode switching in between
+        self._write_registers(
+            # ACC_Config, MAG_Config and GYR_Config_0 are contiguous
+            (_ACCEL_CONFIG_REGISTER, bytes(config[0:3])),
+            (_PAGE_REGISTER, b"\x00"),
+            # as are PWR_MODE and SYS_TRIGGER
+            (_POWER_REGISTER, bytes((_POWER_NORMAL, 0x00))),
+        )
+        self._page = 0
+
+    def reset(self) -> None:
+        """Resets the sensor and restores the configuration it had after
+        construction, in :const:`NDOF_MODE`. Blocks for up to 0.9 seconds while
+        the chip restarts; see :meth:`reset_async` for a non-blocking variant.
+        """
+        self._reset()
+        self._configure()
+
+    async def reset_async(self) -> None:
+        """Like :meth:`reset`, but awaits ``asyncio.sleep()`` for every wait of
+        the reset and the configuration after it, so other tasks keep running.
+        On builds without ``time.monotonic_ns()`` the two mode switches are still
+        slept out, blocking for about 30 ms. Requires ``asyncio``, which on
+        CircuitPython is installed from the library bundle.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        await asyncio.sleep(self._ready_delay())
+        self.mode = CONFIG_MODE
+        await asyncio.sleep(self._ready_delay())
+        self._start_reset()
+        for delay in _reset_delays():
+            await asyncio.sleep(delay)
+            if self._reset_done():
+                await asyncio.sleep(_RESET_SETTLE)
+                break
+        self._finish_reset()
+        self._write_startup_config()
+        await asyncio.sleep(0.01)  # the power mode change, see _configure()
+        self.mode = NDOF_MODE
+        await asyncio.sleep(self._ready_delay())
 
     def _reset(self) -> None:
         """Resets the sensor to default settings."""
         self.mode = CONFIG_MODE
+        self._start_reset()
+        # wait for the chip to reset, polling its id
+        for delay in _reset_delays():
+            time.sleep(delay)
+            if self._reset_done():
+                time.sleep(_RESET_SETTLE)
+                break
+        self._finish_reset()
+
+    def _start_reset(self) -> None:
         try:
             self._write_register(_TRIGGER_REGISTER, 0x20)
         except OSError:  # error due to the chip resetting
             pass
-        # wait for the chip to reset (650 ms typ.)
-        time.sleep(0.7)
+
+    def _reset_done(self) -> bool:
+        try:
+            return self._read_register(_ID_REGISTER) == _CHIP_ID
+        except (OSError, RuntimeError):  # the chip is still booting
+            return False
+
+    def _finish_reset(self) -> None:
+        # the chip always comes out of reset in CONFIG_MODE on page 0
+        self._cached_mode = CONFIG_MODE
+        self._page = 0
 
     @property
     def mode(self) -> int:
@@ -353,38 +611,113 @@ class BNO055:  # pylint: disable=too-many-public-methods
            is calculated from accelerometer, gyroscope and the magnetometer.
 
         """
-        return self._read_register(_MODE_REGISTER) & 0b00001111  # Datasheet Table 4-2
+        if self._cached_mode is None:
+            # Datasheet Table 4-2
+            self._cached_mode = self._read_register(_MODE_REGISTER) & 0b00001111
+        return self._cached_mode
 
     @mode.setter
     def mode(self, new_mode: int) -> None:
-        self._write_register(_MODE_REGISTER, CONFIG_MODE)  # Empirically necessary
-        time.sleep(0.02)  # Datasheet table 3.6
+        if new_mode == self._cached_mode:
+            return
+        self._snapshot_expires = 0  # the outputs change with the mode
+        # Rather than sleeping here, the switch is only waited for by the next
+        # register access. The system status reads idle before a switch to
+        # CONFIG_MODE is done, so that one always gets its full 19 ms; a switch
+        # to an operating mode ends early once the chip reports it running.
+        if self._cached_mode != CONFIG_MODE:
+            self._write_register(_MODE_REGISTER, CONFIG_MODE)  # Empirically necessary
+            self._defer_ready(20000000, None)  # Datasheet table 3.6
         if new_mode != CONFIG_MODE:
             self._write_register(_MODE_REGISTER, new_mode)
-            time.sleep(0.01)  # Table 3.6
+            self._defer_ready(
+                10000000,  # Table 3.6
+                (
+                    _STATUS_FUSION_RUNNING
+                    if (_FUSION_MODES >> new_mode) & 1
+                    else _STATUS_RUNNING
+                ),
+            )
+        self._cached_mode = new_mode
+
+    def refresh_mode(self) -> int:
+        """Re-reads the operation mode from the sensor and returns it.
+
+        :attr:`mode` is cached by the driver, so call this if the sensor may have
+        changed mode behind its back, e.g. after a brown-out or an external reset.
+        """
+        self._cached_mode = None
+        return self.mode
 
     @property
     def calibration_status(self) -> Tuple[int, int, int, int]:
         """Tuple containing sys, gyro, accel, and mag calibration data."""
-        calibration_data = self._read_register(_CALIBRATION_REGISTER)
-        sys = (calibration_data >> 6) & 0x03
-        gyro = (calibration_data >> 4) & 0x03
-        accel = (calibration_data >> 2) & 0x03
-        mag = calibration_data & 0x03
-        return sys, gyro, accel, mag
+        data = self._calibration
+        return (data >> 6) & 0x03, (data >> 4) & 0x03, (data >> 2) & 0x03, data & 0x03
 
     @property
     def calibrated(self) -> bool:
         """Boolean indicating calibration status."""
-        sys, gyro, accel, mag = self.calibration_status
-        return sys == gyro == accel == mag == 0x03
+        # all four 2-bit fields read 3 when fully calibrated
+        return self._calibration == 0xFF
+
+    def wait_calibrated(
+        self,
+        timeout: Optional[float] = None,
+        initial_interval: float = 0.01,
+        max_interval: float = 0.5,
+    ) -> bool:
+        """Blocks until the sensor is fully calibrated or ``timeout`` seconds have
+        passed, and returns whether it is calibrated.
+
+        The calibration status is polled with a delay that starts at
+        ``initial_interval`` and doubles up to ``max_interval``, instead of in a
+        tight loop that would keep the bus busy. ``timeout=None`` waits forever.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = initial_interval
+        while not self.calibrated:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                interval = min(interval, remaining)
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+        return True
+
+    def read_calibration(self) -> Tuple[int, ...]:
+        """Reads all calibration offsets and radii with a single switch to
+        :const:`CONFIG_MODE` and a single bus transaction.
+
+        Returns the 11 raw values in register order: accelerometer offsets
+        (x, y, z), magnetometer offsets (x, y, z), gyroscope offsets (x, y, z),
+        accelerometer radius and magnetometer radius. Pass the tuple to
+        :meth:`write_calibration` to restore it, e.g. after a power cycle.
+        """
+        last_mode = self.mode
+        self.mode = CONFIG_MODE
+        buffer = self._data_buffer
+        self._read_block(_OFFSET_ACCEL_REGISTER, buffer, _CALIBRATION_LENGTH)
+        values = struct.unpack_from("<11h", buffer)
+        self.mode = last_mode
+        return values
+
+    def write_calibration(self, values: Tuple[int, ...]) -> None:
+        """Writes calibration offsets and radii returned by :meth:`read_calibration`
+        with a single switch to :const:`CONFIG_MODE` and a single bus transaction.
+        """
+        last_mode = self.mode
+        self.mode = CONFIG_MODE
+        self._write_block(_OFFSET_ACCEL_REGISTER, struct.pack("<11h", *values))
+        self.mode = last_mode
 
     @property
     def external_crystal(self) -> bool:
         """Switches the use of external crystal on or off."""
         last_mode = self.mode
         self.mode = CONFIG_MODE
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._set_page(0)
         value = self._read_register(_TRIGGER_REGISTER)
         self.mode = last_mode
         return value == 0x80
@@ -393,10 +726,12 @@ class BNO055:  # pylint: disable=too-many-public-methods
     def use_external_crystal(self, value: bool) -> None:
         last_mode = self.mode
         self.mode = CONFIG_MODE
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._set_page(0)
         self._write_register(_TRIGGER_REGISTER, 0x80 if value else 0x00)
-        self.mode = last_mode
+        # the oscillator needs 10 ms to switch; the system status doesn't show
+        # it, so this can't be left to the status poll in _wait_ready()
         time.sleep(0.01)
+        self.mode = last_mode
 
     @property
     def temperature(self) -> int:
@@ -412,9 +747,9 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Gives the raw accelerometer readings, in m/s^2.
         Returns an empty tuple of length 3 when this property has been disabled by the current mode.
         """
-        if self.mode not in [0x00, 0x02, 0x03, 0x06]:
+        if not (_ACCEL_DISABLED_MODES >> self._cached_mode) & 1:
             return self._acceleration
-        return (None, None, None)
+        return _EMPTY_VECTOR
 
     @property
     def _acceleration(self) -> None:
@@ -425,9 +760,9 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Gives the raw magnetometer readings in microteslas.
         Returns an empty tuple of length 3 when this property has been disabled by the current mode.
         """
-        if self.mode not in [0x00, 0x01, 0x03, 0x05, 0x08]:
+        if not (_MAGNET_DISABLED_MODES >> self._cached_mode) & 1:
             return self._magnetic
-        return (None, None, None)
+        return _EMPTY_VECTOR
 
     @property
     def _magnetic(self) -> None:
@@ -438,9 +773,9 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Gives the raw gyroscope reading in radians per second.
         Returns an empty tuple of length 3 when this property has been disabled by the current mode.
         """
-        if self.mode not in [0x00, 0x01, 0x02, 0x04, 0x09, 0x0A]:
+        if not (_GYRO_DISABLED_MODES >> self._cached_mode) & 1:
             return self._gyro
-        return (None, None, None)
+        return _EMPTY_VECTOR
 
     @property
     def _gyro(self) -> None:
@@ -451,9 +786,9 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Gives the calculated orientation angles, in degrees.
         Returns an empty tuple of length 3 when this property has been disabled by the current mode.
         """
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self._cached_mode) & 1:
             return self._euler
-        return (None, None, None)
+        return _EMPTY_VECTOR
 
     @property
     def _euler(self) -> None:
@@ -466,14 +801,28 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Gives the calculated orientation as a quaternion.
         Returns an empty tuple of length 4 when this property has been disabled by the current mode.
         """
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self._cached_mode) & 1:
             return self._quaternion
-        return (None, None, None, None)
+        return _EMPTY_QUATERNION
 
     @property
     def _quaternion(self) -> None:
         raise NotImplementedError("Must be implemented.")
 
+    @property
+    def quaternion_q14(
+        self,
+    ) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+        """Gives the calculated orientation as the raw ``(w, x, y, z)`` quaternion
+        registers, signed integers in Q14 fixed point (divide by 16384 for the unit
+        quaternion). This skips the float scaling of :attr:`quaternion`, which is
+        costly on boards without a hardware FPU.
+        Returns an empty tuple of length 4 when this property has been disabled by the current mode.
+        """
+        if (_FUSION_MODES >> self._cached_mode) & 1:
+            return self._quaternion_q14
+        return _EMPTY_QUATERNION
+
     @property
     def linear_acceleration(
         self,
@@ -481,9 +830,9 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Returns the linear acceleration, without gravity, in m/s.
         Returns an empty tuple of length 3 when this property has been disabled by the current mode.
         """
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self._cached_mode) & 1:
             return self._linear_acceleration
-        return (None, None, None)
+        return _EMPTY_VECTOR
 
     @property
     def _linear_acceleration(self) -> None:
@@ -494,23 +843,118 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Returns the gravity vector, without acceleration in m/s.
         Returns an empty tuple of length 3 when this property has been disabled by the current mode.
         """
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self._cached_mode) & 1:
             return self._gravity
-        return (None, None, None)
+        return _EMPTY_VECTOR
 
     @property
     def _gravity(self) -> None:
         raise NotImplementedError("Must be implemented.")
 
+    def read_all(self) -> Tuple[Tuple[Optional[float], ...], ...]:
+        """Reads all of the sensor outputs in a single bus transaction.
+
+        Returns a tuple of ``(acceleration, magnetic, gyro, euler, quaternion,
+        linear_acceleration, gravity)`` in the same units as the matching properties.
+        Outputs disabled by the current mode are returned as tuples of ``None``,
+        just like the individual properties.
+        """
+        buffer = self._data_buffer
+        self._read_block(_DATA_REGISTER, buffer, _DATA_LENGTH)
+        raw = struct.unpack_from("<22h", buffer)
+        mode = self._cached_mode
+        acceleration = magnetic = gyro = _EMPTY_VECTOR
+        euler = linear_acceleration = gravity = _EMPTY_VECTOR
+        quaternion = _EMPTY_QUATERNION
+        if not (_ACCEL_DISABLED_MODES >> mode) & 1:
+            acceleration = _scaled_vector(raw, 0, _ACCEL_SCALE)
+        if not (_MAGNET_DISABLED_MODES >> mode) & 1:
+            magnetic = _scaled_vector(raw, 3, _MAGNET_SCALE)
+        if not (_GYRO_DISABLED_MODES >> mode) & 1:
+            gyro = _scaled_vector(raw, 6, _GYRO_SCALE)
+        if (_FUSION_MODES >> mode) & 1:
+            euler = _scaled_vector(raw, 9, _EULER_SCALE)
+            quaternion = _scaled_quaternion(raw, 12, _QUATERNION_SCALE)
+            linear_acceleration = _scaled_vector(raw, 16, _ACCEL_SCALE)
+            gravity = _scaled_vector(raw, 19, _ACCEL_SCALE)
+        return (
+            acceleration,
+            magnetic,
+            gyro,
+            euler,
+            quaternion,
+            linear_acceleration,
+            gravity,
+        )
+
+    def read_all_raw(self, buffer: bytearray) -> None:
+        """Reads the raw sensor output registers into ``buffer`` in a single bus
+        transaction, without allocating.
+
+        ``buffer`` must hold at least 46 bytes. It receives registers 0x08 to 0x35
+        (Table 4-2 in the datasheet): little-endian signed 16-bit acceleration (0),
+        magnetic (6), gyro (12), euler (18), quaternion (24), linear acceleration
+        (32) and gravity (38) values, then the temperature (44) and calibration
+        status (45) bytes. Decode only what is needed, e.g. with
+        ``struct.unpack_from("<hhh", buffer, 18)`` for the euler angles; the
+        values are unscaled. With NumPy, ``numpy.frombuffer(buffer, "<i2", 22)``
+        views all of them as one array without copying, and reading into
+        successive rows of a preallocated ``(n, 46)`` ``uint8`` array collects a
+        batch of samples to scale in one operation.
+        """
+        if len(buffer) < _RAW_LENGTH:
+            raise ValueError("buffer must hold at least 46 bytes")
+        self._read_block(_DATA_REGISTER, buffer, _RAW_LENGTH)
+
+    def refresh(self, max_age: float = 0.01) -> None:
+        """Reads all of the sensor outputs in a single bus transaction and serves
+        :attr:`acceleration`, :attr:`magnetic`, :attr:`gyro`, :attr:`euler`,
+        :attr:`quaternion`, :attr:`quaternion_q14`, :attr:`linear_acceleration`,
+        :attr:`gravity`, :attr:`temperature`, :attr:`calibration_status` and
+        :attr:`calibrated` from that snapshot for
+        the next ``max_age`` seconds, instead of reading each one from the sensor.
+        The outputs update at 100 Hz in the fusion modes, so the 10 ms default
+        doesn't hand out stale data.
+
+        Until this is called, or once the snapshot has expired or the mode has
+        changed, each property reads its own registers as usual. Set
+        ``sensor.auto_refresh`` to a number of seconds to have the properties call
+        this themselves whenever the snapshot is older than that, so a loop reading
+        several outputs makes one bus transaction per sample without calling it.
+        """
+        self.read_all_raw(self._snapshot)
+        self._snapshot_expires = time.monotonic() + max_age
+
+    def invalidate(self) -> None:
+        """Discards the snapshot taken by :meth:`refresh`, so the next property
+        access reads fresh data from the sensor."""
+        self._snapshot_expires = 0
+
+    def read_fused(self) -> Tuple[Tuple[Optional[float], ...], ...]:
+        """Reads the sensor fusion outputs in a single bus transaction.
+
+        Returns a tuple of ``(euler, quaternion, linear_acceleration, gravity)`` in
+        the same units as the matching properties. Outside of the fusion modes no
+        bus access happens and tuples of ``None`` are returned.
+        """
+        if not (_FUSION_MODES >> self._cached_mode) & 1:
+            return _EMPTY_VECTOR, _EMPTY_QUATERNION, _EMPTY_VECTOR, _EMPTY_VECTOR
+        buffer = self._data_buffer
+        self._read_block(_FUSED_REGISTER, buffer, _FUSED_LENGTH)
+        raw = struct.unpack_from("<13h", buffer)
+        return (
+            _scaled_vector(raw, 0, _EULER_SCALE),
+            _scaled_quaternion(raw, 3, _QUATERNION_SCALE),
+            _scaled_vector(raw, 7, _ACCEL_SCALE),
+            _scaled_vector(raw, 10, _ACCEL_SCALE),
+        )
+
     @property
     def accel_range(self) -> int:
         """Switch the accelerometer range and return the new range. Default value: +/- 4g
         See table 3-8 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_ACCEL_CONFIG_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00000011 & value
+        return 0b00000011 & self._read_config(_ACCEL_CONFIG_REGISTER)
 
     @accel_range.setter
     def accel_range(self, rng: int = ACCEL_4G) -> None:
@@ -518,11 +962,7 @@ class BNO055:  # pylint: disable=too-many-public-methods
         if self.mode != CONFIG_MODE:
             old_mode = self.mode
             self.mode = CONFIG_MODE
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_ACCEL_CONFIG_REGISTER)
-        masked_value = 0b11111100 & value
-        self._write_register(_ACCEL_CONFIG_REGISTER, masked_value | rng)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_ACCEL_CONFIG_REGISTER, 0b11111100, rng)
         if old_mode is not None:
             self.mode = old_mode
 
@@ -531,24 +971,17 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Switch the accelerometer bandwidth and return the new bandwidth. Default value: 62.5 Hz
         See table 3-8 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_ACCEL_CONFIG_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00011100 & value
+        return 0b00011100 & self._read_config(_ACCEL_CONFIG_REGISTER)
 
     @accel_bandwidth.setter
     def accel_bandwidth(self, bandwidth: int = ACCEL_62_5HZ) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
         old_mode = None
         if self.mode != CONFIG_MODE:
             old_mode = self.mode
             self.mode = CONFIG_MODE
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_ACCEL_CONFIG_REGISTER)
-        masked_value = 0b11100011 & value
-        self._write_register(_ACCEL_CONFIG_REGISTER, masked_value | bandwidth)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_ACCEL_CONFIG_REGISTER, 0b11100011, bandwidth)
         if old_mode is not None:
             self.mode = old_mode
 
@@ -557,44 +990,30 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Switch the accelerometer mode and return the new mode. Default value: Normal
         See table 3-8 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_ACCEL_CONFIG_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b11100000 & value
+        return 0b11100000 & self._read_config(_ACCEL_CONFIG_REGISTER)
 
     @accel_mode.setter
     def accel_mode(self, mode: int = ACCEL_NORMAL_MODE) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_ACCEL_CONFIG_REGISTER)
-        masked_value = 0b00011111 & value
-        self._write_register(_ACCEL_CONFIG_REGISTER, masked_value | mode)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_ACCEL_CONFIG_REGISTER, 0b00011111, mode)
 
     @property
     def gyro_range(self) -> int:
         """Switch the gyroscope range and return the new range. Default value: 2000 dps
         See table 3-9 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_GYRO_CONFIG_0_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00000111 & value
+        return 0b00000111 & self._read_config(_GYRO_CONFIG_0_REGISTER)
 
     @gyro_range.setter
     def gyro_range(self, rng: int = GYRO_2000_DPS) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
         old_mode = None
         if self.mode != CONFIG_MODE:
             old_mode = self.mode
             self.mode = CONFIG_MODE
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_GYRO_CONFIG_0_REGISTER)
-        masked_value = 0b00111000 & value
-        self._write_register(_GYRO_CONFIG_0_REGISTER, masked_value | rng)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_GYRO_CONFIG_0_REGISTER, 0b00111000, rng)
         if old_mode is not None:
             self.mode = old_mode
 
@@ -603,24 +1022,17 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Switch the gyroscope bandwidth and return the new bandwidth. Default value: 32 Hz
         See table 3-9 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_GYRO_CONFIG_0_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00111000 & value
+        return 0b00111000 & self._read_config(_GYRO_CONFIG_0_REGISTER)
 
     @gyro_bandwidth.setter
     def gyro_bandwidth(self, bandwidth: int = GYRO_32HZ) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
         old_mode = None
         if self.mode != CONFIG_MODE:
             old_mode = self.mode
             self.mode = CONFIG_MODE
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_GYRO_CONFIG_0_REGISTER)
-        masked_value = 0b00000111 & value
-        self._write_register(_GYRO_CONFIG_0_REGISTER, masked_value | bandwidth)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_GYRO_CONFIG_0_REGISTER, 0b00000111, bandwidth)
         if old_mode is not None:
             self.mode = old_mode
 
@@ -629,87 +1041,127 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """Switch the gyroscope mode and return the new mode. Default value: Normal
         See table 3-9 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_GYRO_CONFIG_1_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00000111 & value
+        return 0b00000111 & self._read_config(_GYRO_CONFIG_1_REGISTER)
 
     @gyro_mode.setter
     def gyro_mode(self, mode: int = GYRO_NORMAL_MODE) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_GYRO_CONFIG_1_REGISTER)
-        masked_value = 0b00000000 & value
-        self._write_register(_GYRO_CONFIG_1_REGISTER, masked_value | mode)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_GYRO_CONFIG_1_REGISTER, 0b00000000, mode)
 
     @property
     def magnet_rate(self) -> int:
         """Switch the magnetometer data output rate and return the new rate. Default value: 20Hz
         See table 3-10 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_MAGNET_CONFIG_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00000111 & value
+        return 0b00000111 & self._read_config(_MAGNET_CONFIG_REGISTER)
 
     @magnet_rate.setter
     def magnet_rate(self, rate: int = MAGNET_20HZ) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_MAGNET_CONFIG_REGISTER)
-        masked_value = 0b01111000 & value
-        self._write_register(_MAGNET_CONFIG_REGISTER, masked_value | rate)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_MAGNET_CONFIG_REGISTER, 0b01111000, rate)
 
     @property
     def magnet_operation_mode(self) -> int:
         """Switch the magnetometer operation mode and return the new mode. Default value: Regular
         See table 3-10 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_MAGNET_CONFIG_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b00011000 & value
+        return 0b00011000 & self._read_config(_MAGNET_CONFIG_REGISTER)
 
     @magnet_operation_mode.setter
     def magnet_operation_mode(self, mode: int = MAGNET_REGULAR_MODE) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_MAGNET_CONFIG_REGISTER)
-        masked_value = 0b01100111 & value
-        self._write_register(_MAGNET_CONFIG_REGISTER, masked_value | mode)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_MAGNET_CONFIG_REGISTER, 0b01100111, mode)
 
     @property
     def magnet_mode(self) -> int:
         """Switch the magnetometer power mode and return the new mode. Default value: Forced
         See table 3-10 in the datasheet.
         """
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_MAGNET_CONFIG_REGISTER)
-        self._write_register(_PAGE_REGISTER, 0x00)
-        return 0b01100000 & value
+        return 0b01100000 & self._read_config(_MAGNET_CONFIG_REGISTER)
 
     @magnet_mode.setter
     def magnet_mode(self, mode: int = MAGNET_FORCEMODE_MODE) -> None:
-        if self.mode in [0x08, 0x09, 0x0A, 0x0B, 0x0C]:
+        if (_FUSION_MODES >> self.mode) & 1:
             raise RuntimeError("Mode must not be a fusion mode")
-        self._write_register(_PAGE_REGISTER, 0x01)
-        value = self._read_register(_MAGNET_CONFIG_REGISTER)
-        masked_value = 0b00011111 & value
-        self._write_register(_MAGNET_CONFIG_REGISTER, masked_value | mode)
-        self._write_register(_PAGE_REGISTER, 0x00)
+        self._write_config(_MAGNET_CONFIG_REGISTER, 0b00011111, mode)
 
     def _write_register(self, register: int, value: int) -> None:
         raise NotImplementedError("Must be implemented.")
 
+    def _write_block(self, register: int, data: bytes) -> None:
+        raise NotImplementedError("Must be implemented.")
+
+    def _defer_ready(self, delay: int, status: Optional[int]) -> None:
+        # leave the next register access to wait out the next delay ns, or
+        # until the system status reads status, if that isn't None
+        if _monotonic_ns is None:
+            time.sleep(delay / 1000000000)
+            return
+        self._ready_at = _monotonic_ns() + delay
+        self._ready_status = status
+
+    def _ready_delay(self) -> float:
+        # seconds left of a pending mode switch, for reset_async() to await
+        ready_at = self._ready_at
+        if not ready_at:
+            return 0
+        return max(0, ready_at - _monotonic_ns()) / 1000000000
+
+    def _wait_ready(self) -> None:
+        ready_at = self._ready_at
+        if ready_at:
+            # cleared first, the status reads below must not wait themselves
+            self._ready_at = 0
+            if self._ready_status is None:
+                # no status proves the switch done, wait out the whole time
+                delay = ready_at - _monotonic_ns()
+                if delay > 0:
+                    time.sleep(delay / 1000000000)
+                return
+            while _monotonic_ns() < ready_at:
+                time.sleep(0.001)
+                try:
+                    if self._read_register(_STATUS_REGISTER) == self._ready_status:
+                        break
+                except (OSError, RuntimeError):  # the chip is still switching
+                    pass
+
+    def _write_registers(self, *writes: Tuple[int, bytes]) -> None:
+        # each (register, data) pair is one auto-incrementing burst write
+        for register, data in writes:
+            self._write_block(register, data)
+
     def _read_register(self, register: int) -> None:
         raise NotImplementedError("Must be implemented.")
 
+    def _read_block(self, register: int, buffer: bytearray, length: int) -> None:
+        raise NotImplementedError("Must be implemented.")
+
+    def _read_config(self, register: int) -> int:
+        # Page 1 config is always read from the chip, never cached: the fusion
+        # modes manage these registers themselves, and outside of CONFIG_MODE
+        # the chip ignores some writes.
+        self._set_page(1)
+        value = self._read_register(register)
+        self._set_page(0)
+        return value
+
+    def _write_config(self, register: int, keep_mask: int, value: int) -> None:
+        # read-modify-write of one page 1 register, under a single page switch
+        self._set_page(1)
+        config = (self._read_register(register) & keep_mask) | value
+        self._write_register(register, config)
+        self._set_page(0)
+
+    def _set_page(self, page: int) -> None:
+        # only touch the page register when the page actually changes
+        if self._page != page:
+            self._write_register(_PAGE_REGISTER, page)
+            self._page = page
+
     @property
     def axis_remap(self):
         """Return a tuple with the axis remap register values.
@@ -729,13 +1181,14 @@ class BNO055:  # pylint: disable=too-many-public-methods
         Note that the default value, per the datasheet, is NOT P0,
         but rather P1 ()
         """
-        # Get the axis remap register value.
-        map_config = self._read_register(_AXIS_MAP_CONFIG_REGISTER)
+        # Get the adjacent axis remap and axis remap sign registers in one read.
+        buffer = self._data_buffer
+        self._read_block(_AXIS_MAP_CONFIG_REGISTER, buffer, 2)
+        map_config = buffer[0]
         z = (map_config >> 4) & 0x03
         y = (map_config >> 2) & 0x03
         x = map_config & 0x03
-        # Get the axis remap sign register value.
-        sign_config = self._read_register(_AXIS_MAP_SIGN_REGISTER)
+        sign_config = buffer[1]
         x_sign = (sign_config >> 2) & 0x01
         y_sign = (sign_config >> 1) & 0x01
         z_sign = sign_config & 0x01
@@ -759,22 +1212,16 @@ class BNO055:  # pylint: disable=too-many-public-methods
         """
         x, y, z, x_sign, y_sign, z_sign = remap
         # Switch to configuration mode. Necessary to remap axes
-        current_mode = self._read_register(_MODE_REGISTER)
+        current_mode = self.mode
         self.mode = CONFIG_MODE
-        # Set the axis remap register value.
-        map_config = 0x00
-        map_config |= (z & 0x03) << 4
-        map_config |= (y & 0x03) << 2
-        map_config |= x & 0x03
-        self._write_register(_AXIS_MAP_CONFIG_REGISTER, map_config)
-        # Set the axis remap sign register value.
-        sign_config = 0x00
-        sign_config |= (x_sign & 0x01) << 2
-        sign_config |= (y_sign & 0x01) << 1
-        sign_config |= z_sign & 0x01
-        self._write_register(_AXIS_MAP_SIGN_REGISTER, sign_config)
+        # Set the adjacent axis remap and axis remap sign registers in one write.
+        map_config = ((z & 0x03) << 4) | ((y & 0x03) << 2) | (x & 0x03)
+        sign_config = ((x_sign & 0x01) << 2) | ((y_sign & 0x01) << 1) | (z_sign & 0x01)
+        self._write_block(
+            _AXIS_MAP_CONFIG_REGISTER, struct.pack("<BB", map_config, sign_config)
+        )
         # Go back to normal operation mode.
-        self._write_register(_MODE_REGISTER, current_mode)
+        self.mode = current_mode
 
     def set_normal_mode(self) -> None:
         """Sets the sensor to Normal power mode"""
@@ -791,13 +1238,15 @@ class BNO055_I2C(BNO055):
     """
 
     _temperature = _ReadOnlyUnaryStruct(0x34, "b")
-    _acceleration = _ScaledReadOnlyStruct(0x08, "<hhh", 1 / 100)
-    _magnetic = _ScaledReadOnlyStruct(0x0E, "<hhh", 1 / 16)
-    _gyro = _ScaledReadOnlyStruct(0x14, "<hhh", 0.001090830782496456)
-    _euler = _ScaledReadOnlyStruct(0x1A, "<hhh", 1 / 16)
-    _quaternion = _ScaledReadOnlyStruct(0x20, "<hhhh", 1 / (1 << 14))
-    _linear_acceleration = _ScaledReadOnlyStruct(0x28, "<hhh", 1 / 100)
-    _gravity = _ScaledReadOnlyStruct(0x2E, "<hhh", 1 / 100)
+    _acceleration = _ScaledReadOnlyStruct(0x08, "<hhh", _ACCEL_SCALE)
+    _magnetic = _ScaledReadOnlyStruct(0x0E, "<hhh", _MAGNET_SCALE)
+    _gyro = _ScaledReadOnlyStruct(0x14, "<hhh", _GYRO_SCALE)
+    _euler = _ScaledReadOnlyStruct(0x1A, "<hhh", _EULER_SCALE)
+    _quaternion = _ScaledReadOnlyQuaternionStruct(
+        _QUATERNION_REGISTER, "<hhhh", _QUATERNION_SCALE
+    )
+    _linear_acceleration = _ScaledReadOnlyStruct(0x28, "<hhh", _ACCEL_SCALE)
+    _gravity = _ScaledReadOnlyStruct(0x2E, "<hhh", _ACCEL_SCALE)
 
     offsets_accelerometer = _ModeStruct(_OFFSET_ACCEL_REGISTER, "<hhh", CONFIG_MODE)
     """Calibration offsets for the accelerometer"""
@@ -812,21 +1261,66 @@ class BNO055_I2C(BNO055):
     """Radius for magnetometer (cm?)"""
 
     def __init__(self, i2c: I2C, address: int = 0x28) -> None:
-        self.buffer = bytearray(2)
+        # preallocated transfer buffers, so register accesses don't allocate and
+        # reads need no slicing arguments
+        self._write_buffer = bytearray(2)
+        self._register_buffer = bytearray(1)
+        self._value_buffer = bytearray(1)
         self.i2c_device = I2CDevice(i2c, address)
+        # what register accesses lock, swapped for _batch inside batch()
+        self._bus = self.i2c_device
+        self._batch = _I2CBatch(self)
         super().__init__()
 
+    def batch(self) -> _I2CBatch:
+        """Returns a context manager that keeps the I2C bus locked until it exits,
+        so a group of reads doesn't lock and unlock the bus for every transaction:
+
+        .. code-block:: python
+
+            with sensor.batch():
+                euler = sensor.euler
+                gyro = sensor.gyro
+
+        Other devices on the same bus have to wait until the block ends. A mode
+        switch made before the block is waited for before the bus is locked, but
+        one made inside it is waited for (up to 20 ms) with the bus held.
+        """
+        return self._batch
+
     def _write_register(self, register: int, value: int) -> None:
-        self.buffer[0] = register
-        self.buffer[1] = value
-        with self.i2c_device as i2c:
-            i2c.write(self.buffer)
+        self._wait_ready()
+        buffer = self._write_buffer
+        buffer[0] = register
+        buffer[1] = value
+        with self._bus as i2c:
+            i2c.write(buffer)
+
+    def _write_registers(self, *writes: Tuple[int, bytes]) -> None:
+        # hold the bus for the whole sequence instead of once per burst
+        self._wait_ready()
+        with self._bus as i2c:
+            for register, data in writes:
+                i2c.write(bytes((register,)) + data)
+
+    def _write_block(self, register: int, data: bytes) -> None:
+        self._wait_ready()
+        with self._bus as i2c:
+            i2c.write(bytes((register,)) + data)
 
     def _read_register(self, register: int) -> int:
-        self.buffer[0] = register
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(self.buffer, self.buffer, out_end=1, in_start=1)
-        return self.buffer[1]
+        self._wait_ready()
+        self._register_buffer[0] = register
+        # write_then_readinto() joins both phases with a repeated start
+        with self._bus as i2c:
+            i2c.write_then_readinto(self._register_buffer, self._value_buffer)
+        return self._value_buffer[0]
+
+    def _read_block(self, register: int, buffer: bytearray, length: int) -> None:
+        self._wait_ready()
+        self._register_buffer[0] = register
+        with self._bus as i2c:
+            i2c.write_then_readinto(self._register_buffer, buffer, in_end=length)
 
 
 class BNO055_UART(BNO055):
@@ -834,137 +1328,130 @@ class BNO055_UART(BNO055):
     Driver for the BNO055 9DOF IMU sensor via UART.
     """
 
+    _temperature = _ReadOnlyUnaryStruct(0x34, "B")
+    _acceleration = _ScaledReadOnlyStruct(0x08, "<hhh", _ACCEL_SCALE)
+    _magnetic = _ScaledReadOnlyStruct(0x0E, "<hhh", _MAGNET_SCALE)
+    _gyro = _ScaledReadOnlyStruct(0x14, "<hhh", _GYRO_SCALE)
+    _euler = _ScaledReadOnlyStruct(0x1A, "<hhh", _EULER_SCALE)
+    _quaternion = _ScaledReadOnlyQuaternionStruct(
+        _QUATERNION_REGISTER, "<hhhh", _QUATERNION_SCALE
+    )
+    _linear_acceleration = _ScaledReadOnlyStruct(0x28, "<hhh", _ACCEL_SCALE)
+    _gravity = _ScaledReadOnlyStruct(0x2E, "<hhh", _ACCEL_SCALE)
+
     def __init__(self, uart: UART) -> None:
         self._uart = uart
         self._uart.baudrate = 115200
+        # reads block until the response arrives or this many seconds pass
+        self._uart.timeout = 0.25
+        self._header = bytearray(2)
+        self._response = bytearray(6)
+        # read command frame, only the register and length bytes change
+        self._read_command = bytearray((0xAA, 0x01, 0x00, 0x00))
+        self._write_command = bytearray((0xAA, 0x00, 0x00, 0x01, 0x00))
         super().__init__()
 
     def _write_register(  # pylint: disable=arguments-differ,arguments-renamed
         self, register: int, data: int
     ) -> None:
-        if not isinstance(data, bytes):
-            data = bytes([data])
-        self._uart.write(bytes([0xAA, 0x00, register, len(data)]) + data)
-        now = time.monotonic()
-        while self._uart.in_waiting < 2 and time.monotonic() - now < 0.25:
-            pass
-        resp = self._uart.read(self._uart.in_waiting)
-        if len(resp) < 2:
+        self._wait_ready()
+        if isinstance(data, bytes):
+            command = bytes((0xAA, 0x00, register, len(data))) + data
+        else:
+            # single byte writes (mode, page, config) reuse one frame
+            command = self._write_command
+            command[2] = register
+            command[4] = data
+        self._uart.write(command)
+        resp = self._header
+        if self._uart.readinto(resp) != 2:
             raise OSError("UART access error.")
         if resp[0] != 0xEE or resp[1] != 0x01:
             raise RuntimeError(f"UART write error: {resp[1]}")
 
+    def _write_block(self, register: int, data: bytes) -> None:
+        self._write_register(register, bytes(data))
+
     def _read_register(  # pylint: disable=arguments-differ
         self, register: int, length: int = 1
     ) -> int:
-        i = 0
-        while i < 3:
-            self._uart.write(bytes([0xAA, 0x01, register, length]))
-            now = time.monotonic()
-            while self._uart.in_waiting < length + 2 and time.monotonic() - now < 0.1:
-                pass
-            resp = self._uart.read(self._uart.in_waiting)
-            if len(resp) >= 2 and resp[0] == 0xBB:
+        buffer = self._response if length <= len(self._response) else bytearray(length)
+        self._read_block(register, buffer, length)
+        if length > 1:
+            return buffer[0:length]
+        return buffer[0]
+
+    def _read_block(self, register: int, buffer: bytearray, length: int) -> None:
+        self._wait_ready()
+        command = self._read_command
+        command[2] = register
+        command[3] = length
+        resp = self._header
+        # The header is read on its own so an error response, which has no
+        # payload, never leaves bytes behind to corrupt the next frame.
+        for _ in range(3):
+            self._uart.write(command)
+            if self._uart.readinto(resp) != 2:
+                raise OSError("UART access error.")
+            if resp[0] == 0xBB:
                 break
-            i += 1
-        if len(resp) < 2:
-            raise OSError("UART access error.")
-        if resp[0] != 0xBB:
+            # the chip answers with a bus over run error now and then
+            self._uart.reset_input_buffer()
+        else:
             raise RuntimeError(f"UART read error: {resp[1]}")
-        if length > 1:
-            return resp[2:]
-        return int(resp[2])
-
-    @property
-    def _temperature(self) -> int:
-        return self._read_register(0x34)
-
-    @property
-    def _acceleration(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhh", self._read_register(0x08, 6))
-        return tuple(x / 100 for x in resp)
-
-    @property
-    def _magnetic(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhh", self._read_register(0x0E, 6))
-        return tuple(x / 16 for x in resp)
-
-    @property
-    def _gyro(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhh", self._read_register(0x14, 6))
-        return tuple(x * 0.001090830782496456 for x in resp)
-
-    @property
-    def _euler(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhh", self._read_register(0x1A, 6))
-        return tuple(x / 16 for x in resp)
-
-    @property
-    def _quaternion(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhhh", self._read_register(0x20, 8))
-        return tuple(x / (1 << 14) for x in resp)
+        if self._uart.readinto(memoryview(buffer)[0:length]) != length:
+            raise OSError("UART access error.")
 
-    @property
-    def _linear_acceleration(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhh", self._read_register(0x28, 6))
-        return tuple(x / 100 for x in resp)
+    def _read_struct(self, register: int, fmt: str) -> Tuple[int, ...]:
+        # Decode straight out of the response buffer; every offset/radius
+        # register pair fits in it, so no payload copy is made per read.
+        self._read_block(register, self._response, struct.calcsize(fmt))
+        return struct.unpack_from(fmt, self._response)
 
-    @property
-    def _gravity(self) -> Tuple[float, float, float]:
-        resp = struct.unpack("<hhh", self._read_register(0x2E, 6))
-        return tuple(x / 100 for x in resp)
+    def _write_struct(self, register: int, fmt: str, *values: int) -> None:
+        self._write_register(register, struct.pack(fmt, *values))
 
     @property
     def offsets_accelerometer(self) -> Tuple[int, int, int]:
         """Calibration offsets for the accelerometer"""
-        return struct.unpack("<hhh", self._read_register(_OFFSET_ACCEL_REGISTER, 6))
+        return self._read_struct(_OFFSET_ACCEL_REGISTER, "<hhh")
 
     @offsets_accelerometer.setter
     def offsets_accelerometer(self, offsets: Tuple[int, int, int]) -> None:
-        data = bytearray(6)
-        struct.pack_into("<hhh", data, 0, *offsets)
-        self._write_register(_OFFSET_ACCEL_REGISTER, bytes(data))
+        self._write_struct(_OFFSET_ACCEL_REGISTER, "<hhh", *offsets)
 
     @property
     def offsets_magnetometer(self) -> Tuple[int, int, int]:
         """Calibration offsets for the magnetometer"""
-        return struct.unpack("<hhh", self._read_register(_OFFSET_MAGNET_REGISTER, 6))
+        return self._read_struct(_OFFSET_MAGNET_REGISTER, "<hhh")
 
     @offsets_magnetometer.setter
     def offsets_magnetometer(self, offsets: Tuple[int, int, int]) -> None:
-        data = bytearray(6)
-        struct.pack_into("<hhh", data, 0, *offsets)
-        self._write_register(_OFFSET_MAGNET_REGISTER, bytes(data))
+        self._write_struct(_OFFSET_MAGNET_REGISTER, "<hhh", *offsets)
 
     @property
     def offsets_gyroscope(self) -> Tuple[int, int, int]:
         """Calibration offsets for the gyroscope"""
-        return struct.unpack("<hhh", self._read_register(_OFFSET_GYRO_REGISTER, 6))
+        return self._read_struct(_OFFSET_GYRO_REGISTER, "<hhh")
 
     @offsets_gyroscope.setter
     def offsets_gyroscope(self, offsets: Tuple[int, int, int]) -> None:
-        data = bytearray(6)
-        struct.pack_into("<hhh", data, 0, *offsets)
-        self._write_register(_OFFSET_GYRO_REGISTER, bytes(data))
+        self._write_struct(_OFFSET_GYRO_REGISTER, "<hhh", *offsets)
 
     @property
     def radius_accelerometer(self) -> int:
         """Radius for accelerometer (cm?)"""
-        return struct.unpack("<h", self._read_register(_RADIUS_ACCEL_REGISTER, 2))[0]
+        return self._read_struct(_RADIUS_ACCEL_REGISTER, "<h")[0]
 
     @radius_accelerometer.setter
     def radius_accelerometer(self, radius: int) -> None:
-        data = bytearray(2)
-        struct.pack_into("<h", data, 0, radius)
-        self._write_register(_RADIUS_ACCEL_REGISTER, bytes(data))
+        self._write_struct(_RADIUS_ACCEL_REGISTER, "<h", radius)
 
     @property
     def radius_magnetometer(self) -> int:
         """Radius for magnetometer (cm?)"""
-        return struct.unpack("<h", self._read_register(_RADIUS_MAGNET_REGISTER, 2))[0]
+        return self._read_struct(_RADIUS_MAGNET_REGISTER, "<h")[0]
 
     @radius_magnetometer.setter
     def radius_magnetometer(self, radius: int) -> None:
-        data = bytearray(2)
-        struct.pack_into("<h", data, 0, radius)
-        self._write_register(_RADIUS_MAGNET_REGISTER, bytes(data))
+        self._write_struct(_RADIUS_MAGNET_REGISTER, "<h", radius)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+Sample the sensor at a fixed rate in one asyncio task while another task
+keeps running. Each sample is a single bus transaction (read_all), and
+the sampling task sleeps until the next deadline rather than for a fixed
+period, so the rate doesn't drift with the time spent reading. After a
+stall it picks the schedule up again from the current time.
+
+On CircuitPython, install the asyncio library from the bundle.
+"""
+
+import asyncio
+import time
+
+import board
+
+import adafruit_bno055
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+sensor = adafruit_bno055.BNO055_I2C(i2c)
+
+SAMPLE_RATE = 100  # Hz, the fusion output rate
+latest = None
+
+
+async def sample(rate):
+    global latest  # pylint: disable=global-statement
+    # integer nanoseconds: a float monotonic() loses millisecond resolution
+    # after a few hours of uptime on CircuitPython
+    period = 1000000000 // rate
+    deadline = time.monotonic_ns()
+    while True:
+        latest = sensor.read_all()
+        deadline += period
+        now = time.monotonic_ns()
+        # fell behind, e.g. after a stall: resync rather than catch up
+        # with a burst of back-to-back reads
+        deadline = max(deadline, now)
+        await asyncio.sleep((deadline - now) / 1000000000)
+
+
+async def report():
+    while True:
+        if latest is not None:
+            print("Euler angle: {}".format(latest[3]))
+            print("Linear acceleration (m/s^2): {}".format(latest[5]))
+            print()
+        await asyncio.sleep(1)
+
+
+async def main():
+    await asyncio.gather(
+        asyncio.create_task(sample(SAMPLE_RATE)), asyncio.create_task(report())
+    )
+
+
+asyncio.run(main())
@@ -52,39 +52,49 @@ i2c = board.STEMMA_I2C()  # For the built-in STEMMA QT connection
 sensor = adafruit_bno055.BNO055_I2C(i2c)
 sensor.mode = Mode.NDOF_MODE  # Set the sensor to NDOF_MODE
 
+
+def wait_for_calibration(index, label):
+    # Poll one calibration_status field, one bus read per check, backing
+    # off from 50 ms to 0.5 s so completion is noticed promptly
+    delay = 0.05
+    last_status = None
+    status = sensor.calibration_status[index]
+    while status < 3:
+        if status != last_status:
+            print(f"{label} Calib Status: {100 / 3 * status:3.0f}%")
+            last_status = status
+        time.sleep(delay)
+        delay = min(delay * 1.4, 0.5)
+        status = sensor.calibration_status[index]
+
+
 print("Magnetometer: Perform the figure-eight calibration dance.")
-while not sensor.calibration_status[3] == 3:
-    # Calibration Dance Step One: Magnetometer
-    #   Move sensor away from magnetic interference or shields
-    #   Perform the figure-eight until calibrated
-    print(f"Mag Calib Status: {100 / 3 * sensor.calibration_status[3]:3.0f}%")
-    time.sleep(1)
+# Calibration Dance Step One: Magnetometer
+#   Move sensor away from magnetic interference or shields
+#   Perform the figure-eight until calibrated
+wait_for_calibration(3, "Mag")
 print("... CALIBRATED")
 time.sleep(1)
 
 print("Accelerometer: Perform the six-step calibration dance.")
-while not sensor.calibration_status[2] == 3:
-    # Calibration Dance Step Two: Accelerometer
-    #   Place sensor board into six stable positions for a few seconds each:
-    #    1) x-axis right, y-axis up,    z-axis away
-    #    2) x-axis up,    y-axis left,  z-axis away
-    #    3) x-axis left,  y-axis down,  z-axis away
-    #    4) x-axis down,  y-axis right, z-axis away
-    #    5) x-axis left,  y-axis right, z-axis up
-    #    6) x-axis right, y-axis left,  z-axis down
-    #   Repeat the steps until calibrated
-    print(f"Accel Calib Status: {100 / 3 * sensor.calibration_status[2]:3.0f}%")
-    time.sleep(1)
+# Calibration Dance Step Two: Accelerometer
+#   Place sensor board into six stable positions for a few seconds each:
+#    1) x-axis right, y-axis up,    z-axis away
+#    2) x-axis up,    y-axis left,  z-axis away
+#    3) x-axis left,  y-axis down,  z-axis away
+#    4) x-axis down,  y-axis right, z-axis away
+#    5) x-axis left,  y-axis right, z-axis up
+#    6) x-axis right, y-axis left,  z-axis down
+#   Repeat the steps until calibrated
+wait_for_calibration(2, "Accel")
 print("... CALIBRATED")
 time.sleep(1)
 
 print("Gyroscope: Perform the hold-in-place calibration dance.")
-while not sensor.calibration_status[1] == 3:
-    # Calibration Dance Step Three: Gyroscope
-    #  Place sensor in any stable position for a few seconds
-    #  (Accelerometer calibration may also calibrate the gyro)
-    print(f"Gyro Calib Status: {100 / 3 * sensor.calibration_status[1]:3.0f}%")
-    time.sleep(1)
+# Calibration Dance Step Three: Gyroscope
+#  Place sensor in any stable position for a few seconds
+#  (Accelerometer calibration may also calibrate the gyro)
+wait_for_calibration(1, "Gyro")
 print("... CALIBRATED")
 time.sleep(1)
 
@@ -93,3 +103,5 @@ print("Insert these preset offset values into project code:")
 print(f"  Offsets_Magnetometer:  {sensor.offsets_magnetometer}")
 print(f"  Offsets_Gyroscope:     {sensor.offsets_gyroscope}")
 print(f"  Offsets_Accelerometer: {sensor.offsets_accelerometer}")
+print("Or restore all offsets and radii at once with sensor.write_calibration():")
+print(f"  Calibration: {sensor.read_calibration()}")
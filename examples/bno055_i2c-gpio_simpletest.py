@@ -18,6 +18,9 @@ import adafruit_bno055
 
 # To enable i2c-gpio, add the line `dtoverlay=i2c-gpio` to /boot/config.txt
 # Then reboot the pi
+# The bit-banged bus defaults to roughly 100 kHz; lower the delay to speed it
+# up towards the BNO055's 400 kHz fast mode, e.g.
+# `dtoverlay=i2c-gpio,i2c_gpio_delay_us=2`
 
 # Create library object using our Extended Bus I2C port
 # Use `ls /dev/i2c*` to find out what i2c devices are connected
@@ -31,14 +34,16 @@ def temperature():
     global last_val  # pylint: disable=global-statement
     result = sensor.temperature
     if abs(result - last_val) == 128:
-        result = sensor.temperature
-        if abs(result - last_val) == 128:
-            return 0b00111111 & result
+        # the temperature can't really move 128 degrees between readings; that
+        # is bit 7 reading wrong, so mask it off instead of reading again
+        return 0b00111111 & result
     last_val = result
     return result
 
 
 while True:
+    # read every output in one transaction; the prints below use this snapshot
+    sensor.refresh(max_age=0.5)
     print("Temperature: {} degrees C".format(temperature()))
     print("Accelerometer (m/s^2): {}".format(sensor.acceleration))
     print("Magnetometer (microteslas): {}".format(sensor.magnetic))
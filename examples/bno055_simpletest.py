@@ -7,6 +7,7 @@ import adafruit_bno055
 
 
 i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = busio.I2C(board.SCL, board.SDA, frequency=400000)  # 400 kHz fast mode, needs import busio
 # i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
 sensor = adafruit_bno055.BNO055_I2C(i2c)
 
@@ -21,14 +22,16 @@ def temperature():
     global last_val  # pylint: disable=global-statement
     result = sensor.temperature
     if abs(result - last_val) == 128:
-        result = sensor.temperature
-        if abs(result - last_val) == 128:
-            return 0b00111111 & result
+        # the temperature can't really move 128 degrees between readings; that
+        # is bit 7 reading wrong, so mask it off instead of reading again
+        return 0b00111111 & result
     last_val = result
     return result
 
 
 while True:
+    # read every output in one transaction; the prints below use this snapshot
+    sensor.refresh(max_age=0.5)
     print("Temperature: {} degrees C".format(sensor.temperature))
     """
     print(
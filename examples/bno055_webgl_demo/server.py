@@ -14,6 +14,7 @@
 # 2019 update: Carter Nelson
 
 import json
+import os
 import threading
 import time
 
@@ -23,7 +24,10 @@ import flask
 
 import adafruit_bno055
 
-i2c = busio.I2C(board.SCL, board.SDA)
+# The BNO055 supports 400 kHz fast mode.  On a Raspberry Pi the bus clock is
+# set by the kernel instead, add `dtparam=i2c_arm_baudrate=400000` to
+# /boot/config.txt and reboot.
+i2c = busio.I2C(board.SCL, board.SDA, frequency=400000)
 
 # Create the BNO sensor connection.
 bno = adafruit_bno055.BNO055_I2C(i2c)
@@ -56,32 +60,75 @@ app = flask.Flask(__name__)
 # This will be accessed from multiple threads so care needs to be taken to
 # protect access with a lock (or else inconsistent/partial results might be read).
 # A condition object is used both as a lock for safe access across threads, and
-# to notify threads that the BNO state has changed.
-bno_data = {}
+# to notify threads that the BNO state has changed.  The reading is stored already
+# formatted as a server sent event, so it is serialized once per reading rather
+# than once per connected client, and clients only hold the lock long enough to
+# pick it up.
+bno_event = None
 bno_changed = threading.Condition()
 
-# Background thread to read BNO sensor data.  Will be created right before
-# the first request is served (see start_bno_thread below).
-bno_thread = None
+
+def format_bno_event():
+    """Function to read the BNO sensor and return its latest orientation, etc.
+    state formatted as an HTML5 server sent event, in bytes.
+    """
+    # Read all of the outputs in one I2C transaction; the properties below
+    # are then served from that snapshot.
+    bno.refresh()
+    heading, roll, pitch = bno.euler
+    temp = bno.temperature
+    x, y, z, w = bno.quaternion
+    sys, gyro, accel, mag = bno.calibration_status
+    data = {
+        "heading": heading,
+        "roll": roll,
+        "pitch": pitch,
+        "temp": temp,
+        "quatX": x,
+        "quatY": y,
+        "quatZ": z,
+        "quatW": w,
+        "calSys": sys,
+        "calGyro": gyro,
+        "calAccel": accel,
+        "calMag": mag,
+    }
+    # Encode once here rather than have flask encode it for every client.
+    return "data: {0}\n\n".format(json.dumps(data)).encode("ascii")
 
 
 def read_bno():
-    """Function to read the BNO sensor and update the bno_data object with the
+    """Function to read the BNO sensor and update bno_event with the
     latest BNO orientation, etc. state.  Must be run in its own thread because
     it will never return!
     """
+    global bno_event  # pylint: disable=global-statement
+    # Ask for real-time priority so the Flask workers can't delay readings.
+    # Applies to this thread only, and needs root; otherwise carry on as is.
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+    except (AttributeError, OSError):
+        pass
+    period = 1.0 / BNO_UPDATE_FREQUENCY_HZ
+    next_reading = time.monotonic()
     while True:
-        # Capture the lock on the bno_changed condition so the bno_data shared
-        # state can be updated.
+        event = format_bno_event()
+        # Capture the lock on the bno_changed condition so the shared state
+        # can be updated.
         with bno_changed:
-            bno_data["euler"] = bno.euler
-            bno_data["temp"] = bno.temperature
-            bno_data["quaternion"] = bno.quaternion
-            bno_data["calibration"] = bno.calibration_status
+            bno_event = event
             # Notify any waiting threads that the BNO state has been updated.
             bno_changed.notify_all()
-        # Sleep until the next reading.
-        time.sleep(1.0 / BNO_UPDATE_FREQUENCY_HZ)
+        # Sleep until the next reading is due.  Scheduling against a deadline
+        # rather than sleeping a whole period keeps the rate steady no matter
+        # how long the reading took.
+        next_reading += period
+        delay = next_reading - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Fell behind, start counting again from now instead of bursting.
+            next_reading = time.monotonic()
 
 
 def bno_sse():
@@ -100,40 +147,9 @@ def bno_sse():
             bno_changed.wait()
             # A new reading is available!  Grab the reading value and then give
             # up the lock.
-            heading, roll, pitch = bno_data["euler"]
-            temp = bno_data["temp"]
-            x, y, z, w = bno_data["quaternion"]
-            sys, gyro, accel, mag = bno_data["calibration"]
-        # Send the data to the connected client in HTML5 server sent event format.
-        data = {
-            "heading": heading,
-            "roll": roll,
-            "pitch": pitch,
-            "temp": temp,
-            "quatX": x,
-            "quatY": y,
-            "quatZ": z,
-            "quatW": w,
-            "calSys": sys,
-            "calGyro": gyro,
-            "calAccel": accel,
-            "calMag": mag,
-        }
-        yield "data: {0}\n\n".format(json.dumps(data))
-
-
-@app.before_first_request
-def start_bno_thread():
-    # Start the BNO thread right before the first request is served.  This is
-    # necessary because in debug mode flask will start multiple main threads so
-    # this is the only spot to put code that can only run once after starting.
-    # See this SO question for more context:
-    #   http://stackoverflow.com/questions/24617795/starting-thread-while-running-flask-with-debug
-    global bno_thread  # pylint: disable=global-statement
-    # Kick off BNO055 reading thread.
-    bno_thread = threading.Thread(target=read_bno)
-    bno_thread.daemon = True  # Don't let the BNO reading thread block exiting.
-    bno_thread.start()
+            event = bno_event
+        # Send the data to the connected client.
+        yield event
 
 
 @app.route("/bno")
@@ -167,9 +183,13 @@ def root():
 
 
 if __name__ == "__main__":
+    # Kick off the BNO055 reading thread.  It is a daemon thread so it doesn't
+    # block exiting.
+    threading.Thread(target=read_bno, daemon=True).start()
     # Create a server listening for external connections on the default
-    # port 5000.  Enable debug mode for better error messages and live
-    # reloading of the server on changes.  Also make the server threaded
-    # so multiple connections can be processed at once (very important
-    # for using server sent events).
-    app.run(host="0.0.0.0", debug=True, threaded=True)
+    # port 5000.  Enable debug mode for better error messages, but not the
+    # reloader: it would run this script a second time in a child process,
+    # opening the sensor and starting a reading thread twice.  Also make the
+    # server threaded so multiple connections can be processed at once (very
+    # important for using server sent events).
+    app.run(host="0.0.0.0", debug=True, threaded=True, use_reloader=False)